@@ -17,6 +17,21 @@ class Board:
         self.b_array = np.zeros(shape=self.shape, dtype=np.int8)
         self.nmove = 1  # This has to be set to 1 as this has implication in main
 
+    @property
+    def b_array(self) -> np.ndarray:
+        """ Read-only view of the board. The win check is cached per move, so the board
+            can only be changed through add_piece or by assigning a new array """
+        return self._b_view
+
+    @b_array.setter
+    def b_array(self, b_array:np.ndarray) -> None:
+        """ Copies the given board. This forgets the last move, so the next win check scans the full board """
+        self._b_array = np.array(b_array, dtype=np.int8)
+        self._b_view = self._b_array.view()
+        self._b_view.flags.writeable = False
+        self.last_move = None
+        self._won = None
+
     @property
     def available_cols(self) -> List[int]:
         """ Returns list of columns that are not completely filled """
@@ -37,7 +52,11 @@ class Board:
     
     @property
     def won(self) -> bool:
-        return self._check_win()
+        """ Win result is cached until the board changes. If the last move is known only the
+            lines through it are checked, otherwise the full board is scanned """
+        if self._won is None:
+            self._won = self._check_win() if self.last_move is None else self._check_win_at(*self.last_move)
+        return self._won
 
     @property
     def drawn(self) -> bool:
@@ -47,28 +66,6 @@ class Board:
         """ Returns True if board is completely filled """
         return np.count_nonzero(self.b_array) >= self.b_array.size
 
-    def _check_win(self) -> bool:
-        """ Updates the internal values of won and drawn """
-        def found_pattern(b_array:np.ndarray) -> bool:
-            """ Returns True if the required pattern found in 2D array """
-            assert(b_array.ndim > 1), "2D array expected here"
-            for rows in sliding_window_view(b_array, (1, self.win_at)):
-                for window in rows:
-                    # print(f'window: {window} sum: {abs(np.sum(window))}')
-                    if abs(np.sum(window)) == self.win_at:
-                        return True
-            return False
-
-        def check_diagonal_arr(arr:np.ndarray) -> bool:
-            """ Returns True if the diagonals contains a win condition. """
-            for i in range(-arr.shape[0] + 1, arr.shape[1]):
-                print(f'diag: {np.diag(arr, k=i)} sum: {abs(np.sum(np.diag(arr, k=i))) }')
-                if abs(np.sum(np.diag(arr, k=i))) >= self.win_at:
-                    return True
-            return False
-        return found_pattern(self.b_array) | found_pattern(self.b_array.T) | check_diagonal_arr(self.b_array) | check_diagonal_arr(np.fliplr(self.b_array))
-
-    
     def _check_win(self) -> bool:
         """ Returns True if win condition found """
         def found_pattern1(arr:np.ndarray) -> bool:
@@ -97,14 +94,35 @@ class Board:
                     return True
         return False
     
+    def _check_win_at(self, row:int, col:int) -> bool:
+        """ Returns True if the piece at (row, col) completes a win. Only the four lines
+            through this cell are examined, so the cost does not depend on the board size """
+        piece = self.b_array[row, col]
+        if piece == 0:
+            return False
+        nrows, ncols = self.shape
+        for d_row, d_col in LINE_DIRECTIONS:
+            count = 1
+            # Walk away from the piece in both directions along the line
+            for sign in (1, -1):
+                r, c = row + sign * d_row, col + sign * d_col
+                while 0 <= r < nrows and 0 <= c < ncols and self.b_array[r, c] == piece:
+                    count += 1
+                    r, c = r + sign * d_row, c + sign * d_col
+            if count >= self.win_at:
+                return True
+        return False
+
     def add_piece(self, col:int, piece:PieceType = 1) -> bool:
         """ Adds piece to given col, return False if addition not poosible, updates the board """
         if col not in self.available_cols:
             return False
         # Determine addition index
         at = max(np.where(self.b_array.T[col] == 0)[0])
-        self.b_array.T[col, at] = piece
+        self._b_array.T[col, at] = piece
         self.nmove += 1
+        self.last_move = (int(at), col)
+        self._won = None
         return True
     
     def render(self, labelkey:dict, info:dict=None, stats:Dict[str, str]=None) -> None:
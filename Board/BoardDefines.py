@@ -1,6 +1,8 @@
 from typing import Literal
 
 PieceType = Literal[1, -1]
+# Directions (row, col) of the lines a win can be made on
+LINE_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
 # GUI defines
 # Chanege these to affect the size of of the board!
 LINE_WIDTH  = 2
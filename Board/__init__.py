@@ -1,3 +1,4 @@
 from .Board import Board
+from .BitBoard import BitBoard
 from .BoardGUI import BoardInfo
 from .BoardGUI import BoardGUI
\ No newline at end of file
@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+from ..Board import Board
+from ..BitBoard import BitBoard, has_won, bit_index
+
+
+class Test_BitBoard:
+    def test_bit_index(self):
+        # Bottom left cell is bit 0, every column has one sentinel bit on top
+        assert(bit_index(row=2, col=0, rows=3) == 0)
+        assert(bit_index(row=0, col=0, rows=3) == 2)
+        assert(bit_index(row=2, col=1, rows=3) == 4)
+
+    def test_has_won(self):
+        rows = 6
+        cells = lambda idxs: sum(1 << bit_index(r, c, rows) for r, c in idxs)
+        assert(has_won(cells([(5, 0), (5, 1), (5, 2), (5, 3)]), rows, 4) == True)
+        assert(has_won(cells([(5, 0), (4, 0), (3, 0), (2, 0)]), rows, 4) == True)
+        assert(has_won(cells([(5, 0), (4, 1), (3, 2), (2, 3)]), rows, 4) == True)
+        assert(has_won(cells([(2, 0), (3, 1), (4, 2), (5, 3)]), rows, 4) == True)
+        assert(has_won(cells([(5, 0), (5, 1), (5, 2), (5, 4)]), rows, 4) == False)
+        # No wrap around from the top of one column to the bottom of the next
+        assert(has_won(cells([(1, 0), (0, 0), (5, 1), (4, 1)]), rows, 4) == False)
+        assert(has_won(cells([(5, 0), (5, 1), (5, 2)]), rows, 3) == True)
+        assert(has_won(cells([(5, 0), (5, 1), (5, 2), (5, 3), (5, 4)]), rows, 5) == True)
+
+    def test_add_piece(self):
+        board = BitBoard(rows=3, cols=4, win_at=2)
+        assert(board.add_piece(col=0, piece=-1) == True)
+        assert(board.add_piece(col=0, piece=1) == True)
+        assert(board.add_piece(col=0, piece=1) == True)
+        ref_b_array = np.array([
+            [ 1,  0,  0,  0,],
+            [ 1,  0,  0,  0,],
+            [-1,  0,  0,  0,],
+        ], dtype=np.int8)
+        assert(np.array_equal(ref_b_array, board.b_array)), "Arrays not the same"
+        assert(board.add_piece(col=0, piece=1) == False), "Addition now not possible"
+        assert(board.add_piece(col=4, piece=1) == False), "Column out of range"
+        assert(board.available_cols == [1, 2, 3])
+        assert(board.won == True)
+
+    def test_b_array_assignment(self):
+        board = BitBoard(rows=3, cols=3, win_at=3)
+        board.b_array = np.array([
+            [ 1,  0, -1],
+            [-1, -1,  1],
+            [-1, -1,  1],
+        ], dtype=np.int8)
+        assert(board.available_cols == [1])
+        assert(board.won == True)
+        assert(board.drawn == False)
+
+        board.b_array = np.array([
+            [ 1,  0,  0],
+            [-1, -1,  1],
+            [-1, -1,  1],
+        ], dtype=np.int8)
+        assert(board.won == False)
+        board.add_piece(col=1, piece=-1)
+        assert(board.won == True)
+
+    def test_numpy_columns(self):
+        # NumPy integer columns must not overflow the bitmask on boards with more than 64 bits
+        board = BitBoard(rows=8, cols=9, win_at=5)
+        for col in np.array([8, 7, 6, 5], dtype=np.int64):
+            board.add_piece(col=col, piece=-1)
+            assert(board.bits[-1] > 0)
+        assert(board.won == False)
+        board.add_piece(col=np.int64(4), piece=-1)
+        assert(board.won == True)
+
+    def test_b_array_read_only(self):
+        board = BitBoard(rows=3, cols=3, win_at=3)
+        board.add_piece(col=1, piece=1)
+        with pytest.raises(ValueError):
+            board.b_array[0, 0] = 1
+        assert(board.b_array[2, 1] == 1), "Pending move must be visible in b_array"
+
+    def test_matches_board(self):
+        rng = np.random.default_rng(3)
+        for rows, cols, win_at in [(6, 7, 4), (4, 5, 3), (8, 9, 5)]:
+            board, bitboard = Board(rows, cols, win_at), BitBoard(rows, cols, win_at)
+            for _ in range(20):
+                board.reset()
+                bitboard.reset()
+                piece = 1
+                while not (board.won or board.drawn):
+                    assert(board.available_cols == bitboard.available_cols)
+                    col = rng.choice(board.available_cols)
+                    assert(board.add_piece(col, piece) == bitboard.add_piece(col, piece))
+                    assert(np.array_equal(board.b_array, bitboard.b_array))
+                    assert(board.won == bitboard.won)
+                    assert(board.drawn == bitboard.drawn)
+                    piece *= -1
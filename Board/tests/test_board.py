@@ -1,3 +1,4 @@
+import pytest
 import numpy as np
 from pathlib import Path
 from ..BoardDefines import RED, BLACK
@@ -228,6 +229,69 @@ class Test_board:
         assert(board.won == True)
         assert(board.drawn == False)
 
+    def test_won_last_move(self):
+        board = Board(rows=6, cols=7, win_at=4)
+        # Horizontal win through the last dropped piece
+        for col in [0, 1, 3]:
+            board.add_piece(col=col, piece=1)
+            assert(board.won == False)
+        board.add_piece(col=2, piece=1)
+        assert(board.last_move == (5, 2))
+        assert(board.won == True)
+
+        # Diagonal win, last piece dropped in the middle of the line
+        board.reset()
+        board.b_array = np.array([
+            [ 0, 0, 0, 0, 0, 0, 0],
+            [ 0, 0, 0, 0, 0, 0, 0],
+            [ 0, 0, 0, 0, 1, 0, 0],
+            [ 0, 0, 0, 0,-1, 0, 0],
+            [ 0, 0, 1,-1,-1, 0, 0],
+            [ 0, 1,-1,-1, 1, 0, 0]], dtype=np.int8)
+        assert(board.won == False)
+        board.add_piece(col=3, piece=1)
+        assert(board.last_move == (3, 3))
+        assert(board.won == True)
+
+        # Cached result is invalidated by the next move and by reset
+        board.b_array = np.array([
+            [ 0, 0, 0, 0, 0, 0, 0],
+            [ 0, 0, 0, 0, 0, 0, 0],
+            [ 0, 0, 0, 0, 0, 0, 0],
+            [ 0, 0, 0, 0, 0, 0, 0],
+            [ 0, 0, 0, 0, 0, 0, 0],
+            [ 1, 1, 1, 0, 0, 0, 0]], dtype=np.int8)
+        assert(board.won == False)
+        board.add_piece(col=3, piece=1)
+        assert(board.won == True)
+        board.reset()
+        assert(board.won == False)
+
+    def test_b_array_read_only(self):
+        board = Board(rows=3, cols=3, win_at=3)
+        with pytest.raises(ValueError):
+            board.b_array[2, 0] = 1
+        # Assigned boards are copied, later changes to the source do not leak in
+        b_array = np.zeros(shape=(3, 3), dtype=np.int8)
+        board.b_array = b_array
+        b_array[2, :] = 1
+        assert(board.won == False)
+        assert(np.count_nonzero(board.b_array) == 0)
+
+    def test_won_matches_full_scan(self):
+        rng = np.random.default_rng(7)
+        for rows, cols, win_at in [(6, 7, 4), (4, 5, 3), (9, 10, 5)]:
+            board = Board(rows=rows, cols=cols, win_at=win_at)
+            for _ in range(20):
+                board.reset()
+                piece = 1
+                while board.available_cols:
+                    board.add_piece(col=rng.choice(board.available_cols), piece=piece)
+                    assert(board.won == board._check_win()), "Incremental and full scan differ"
+                    if board.won:
+                        break
+                    piece *= -1
+
 def test_BoardGUI_render():
     test_path = Path(__file__).parent / 'test_BoardGUI_render.jpg'
     ref_path = Path(__file__).parent / 'ref_test_BoardGUI_render.jpg'
@@ -1,6 +1,6 @@
 import numpy as np
 from .EnvDefines import *
-from Board import Board
+from Board import Board, BitBoard
 from Players import PlayerBase
 from gym import Env, spaces
 from typing import Tuple, Dict
@@ -15,7 +15,7 @@ class WLDEnum(Enum):
 
 class FourInRowEnv(Env):
 
-    def __init__(self, rows: int = 6, cols: int = 7, render = False) -> None:
+    def __init__(self, rows: int = 6, cols: int = 7, render = False, bitboard:bool = False) -> None:
         assert(rows > 4), "rows must > 4"
         assert(cols > 4), "cols must > 4"
         self.ngame = -1
@@ -23,7 +23,9 @@ class FourInRowEnv(Env):
         self.action_space = spaces.Discrete(cols)
         self.observation_space = spaces.Box(low=-1, high=1, shape=self.shape, dtype=np.int8)
         self.render_env = render
-        self.board = Board(rows=self.rows, cols=self.cols, win_at=FOUR)
+        # The bitboard engine is faster but exposes the same interface
+        board_cls = BitBoard if bitboard else Board
+        self.board = board_cls(rows=self.rows, cols=self.cols, win_at=FOUR)
         self.reset()
         self.trainer:PlayerBase = None
 
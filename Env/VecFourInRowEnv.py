@@ -0,0 +1,126 @@
+import numpy as np
+from .EnvDefines import *
+from .FourInRowEnv import WLDEnum
+from Players import PlayerBase
+from gym import spaces
+from typing import Tuple, Dict
+
+
+class VecFourInRowEnv:
+    """ Steps num_envs games at once. All boards live in a single (N, rows, cols) int8
+        array and learner moves, trainer moves, win/draw detection, rewards and resets
+        are done as batched array operations. Follows the rules of FourInRowEnv """
+    def __init__(self, num_envs: int, rows: int = 6, cols: int = 7) -> None:
+        assert(num_envs > 0), "num_envs must > 0"
+        assert(rows > 4), "rows must > 4"
+        assert(cols > 4), "cols must > 4"
+        self.num_envs = num_envs
+        self.shape = (rows, cols)
+        self.win_at = FOUR
+        self.single_action_space = spaces.Discrete(cols)
+        self.action_space = spaces.MultiDiscrete([cols] * num_envs)
+        self.observation_space = spaces.Box(low=-1, high=1, shape=(num_envs, *self.shape), dtype=np.int8)
+        self.boards = np.zeros(shape=(num_envs, *self.shape), dtype=np.int8)
+        self.heights = np.zeros(shape=(num_envs, cols), dtype=np.int64)
+        self.ngame = np.full(num_envs, -1, dtype=np.int64)
+        self.nwrong_moves = np.zeros(num_envs, dtype=np.int64)
+        self._env_ids = np.arange(num_envs)
+        self.reset()
+        self.trainer:PlayerBase = None
+
+    @property
+    def cols(self) -> int:
+        return self.shape[1]
+
+    @property
+    def rows(self) -> int:
+        return self.shape[0]
+
+    @property
+    def state(self) -> np.ndarray:
+        return self.boards
+
+    def register_trainer(self, player:PlayerBase) -> None:
+        """ The trainer plays all games, its get_actions gets the boards from its perspective """
+        self.trainer = player
+
+    def reset(self) -> ObsType:
+        self.reset_envs(np.ones(self.num_envs, dtype=bool))
+        return self.state
+
+    def reset_envs(self, mask:np.ndarray) -> None:
+        """ Resets the games selected by the boolean mask """
+        self.boards[mask] = 0
+        self.heights[mask] = 0
+        self.ngame[mask] += 1
+        self.nwrong_moves[mask] = 0
+
+    def step(self, actions: np.ndarray) -> Tuple[ObsType, np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """ Learner plays actions[i] on game i, then the trainer answers on every game
+            where the learner made a legal move that did not finish it. Finished games
+            are reset, their last board is returned in infos['final_observation'].
+            The returned observation is the live board array """
+        actions = np.asarray(actions, dtype=np.int64)
+        assert(actions.shape == (self.num_envs,)), "One action per env expected"
+        assert(np.all((actions >= 0) & (actions < self.cols))), "Action not part of action_space"
+        rewards = np.zeros(self.num_envs, dtype=np.float32)
+        dones = np.zeros(self.num_envs, dtype=bool)
+        wld = np.full(self.num_envs, WLDEnum.CONTINUE.value, dtype=np.int8)
+
+        # Learner step, moves into filled columns are penalized and skip the trainer step
+        legal = self.heights[self._env_ids, actions] < self.rows
+        wrong = ~legal
+        rewards[wrong] = WrongValue
+        wld[wrong] = WLDEnum.WRONG_MOVE.value
+        self.nwrong_moves[wrong] += 1
+        self._act(self._env_ids[legal], actions[legal], 1, rewards, dones, wld)
+
+        # Trainer step on all games still running
+        env_ids = self._env_ids[legal & ~dones]
+        if env_ids.size:
+            assert(self.trainer is not None), "Trainer has not been set!"
+            trainer_actions = np.asarray(self.trainer.get_actions(np.negative(self.boards[env_ids])), dtype=np.int64)
+            assert(np.all(self.heights[env_ids, trainer_actions] < self.rows)), "Wrong MOVE from trainer!!"
+            self._act(env_ids, trainer_actions, -1, rewards, dones, wld)
+
+        infos = {
+            'wld': wld,
+            'nwrong_moves': self.nwrong_moves.copy(),
+            'final_observation': self.boards.copy(),
+        }
+        if dones.any():
+            self.reset_envs(dones)
+        return self.state, rewards, dones, infos
+
+    def _act(self, env_ids:np.ndarray, actions:np.ndarray, piece:int, rewards:np.ndarray, dones:np.ndarray, wld:np.ndarray) -> None:
+        """ Drops piece into the given columns and updates rewards, dones and wld for these games """
+        rows = self.rows - 1 - self.heights[env_ids, actions]
+        self.boards[env_ids, rows, actions] = piece
+        self.heights[env_ids, actions] += 1
+
+        won = self._won(self.boards[env_ids], piece)
+        drawn = ~won & np.all(self.heights[env_ids] >= self.rows, axis=1)
+        rewards[env_ids[won]] = WonValue if piece == 1 else LostValue
+        wld[env_ids[won]] = WLDEnum.WON.value if piece == 1 else WLDEnum.LOST.value
+        rewards[env_ids[drawn]] = DrawnValue
+        wld[env_ids[drawn]] = WLDEnum.DRAWN.value
+        dones[env_ids[won | drawn]] = True
+
+    def _won(self, boards:np.ndarray, piece:int) -> np.ndarray:
+        """ Returns per board if piece has win_at aligned stones. Equivalent to a convolution
+            with the horizontal, vertical and both diagonal line kernels """
+        n, rows, cols = boards.shape
+        w = self.win_at
+        target = piece * w
+        # Windows are summed in a wider dtype so that win_at is not limited by int8
+        boards = boards.astype(np.int16)
+        lines = (
+            sum(boards[:, :, k:cols - w + 1 + k] for k in range(w)),
+            sum(boards[:, k:rows - w + 1 + k, :] for k in range(w)),
+            sum(boards[:, k:rows - w + 1 + k, k:cols - w + 1 + k] for k in range(w)),
+            sum(boards[:, k:rows - w + 1 + k, w - 1 - k:cols - k] for k in range(w)),
+        )
+        won = np.zeros(n, dtype=bool)
+        for line in lines:
+            won |= (line == target).reshape(n, -1).any(axis=1)
+        return won
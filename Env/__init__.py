@@ -1,3 +1,4 @@
 from .EnvDefines import ObsType, ActType
 from .FourInRowEnv import FourInRowEnv
-from .FourInRowEnv import WLDEnum
\ No newline at end of file
+from .FourInRowEnv import WLDEnum
+from .VecFourInRowEnv import VecFourInRowEnv
\ No newline at end of file
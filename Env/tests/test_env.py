@@ -207,6 +207,19 @@ class Test_FourInRowEnv:
         assert(wrong_moves == 0), "Incorrect wrong moves"
         assert(done == True), "Incorrect done" 
 
+    def test_bitboard_episode(self):
+        env = FourInRowEnv(bitboard=True)
+        env.register_trainer(SequentialPlayer('TST'))
+        # Learner stacks column 6 while the trainer plays columns 0, 1 and 2
+        for _ in range(3):
+            state, reward, done, info = env.step(action=6)
+            assert(done == False), "Incorrect done"
+        state, reward, done, info = env.step(action=6)
+        assert(info[0] == WLDEnum.WON), "Learner must win on column 6"
+        assert(reward == WonValue), "Incorrect reward"
+        assert(done == True), "Incorrect done"
+        assert(np.count_nonzero(state[:, 6]) == 4)
+
 
 class Test_FourInRowEnv_Render:
     def test_step_render_draw(self):
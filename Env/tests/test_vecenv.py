@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+from ..EnvDefines import *
+from .. import FourInRowEnv, VecFourInRowEnv, WLDEnum
+from Players import NNPlayerBase
+from Players.PlayerBase import get_available_cols
+
+
+class FirstColPlayer(NNPlayerBase):
+    """ Deterministic trainer that plays the first available col """
+    def get_action(self, state):
+        return get_available_cols(state)[0]
+
+
+class Test_VecFourInRowEnv:
+    def test_reset(self):
+        env = VecFourInRowEnv(num_envs=3)
+        state = env.reset()
+        assert(state.shape == (3, 6, 7))
+        assert(np.count_nonzero(state) == 0)
+        assert(np.array_equal(env.ngame, [1, 1, 1]))
+
+    def test_step(self):
+        env = VecFourInRowEnv(num_envs=2)
+        env.register_trainer(FirstColPlayer('TST'))
+        state, rewards, dones, infos = env.step(np.array([3, 0]))
+        assert(state[0, 5, 3] == 1 and state[0, 5, 0] == -1)
+        assert(state[1, 5, 0] == 1 and state[1, 4, 0] == -1)
+        assert(np.array_equal(rewards, [0, 0]))
+        assert(np.array_equal(dones, [False, False]))
+        assert(np.array_equal(infos['wld'], [WLDEnum.CONTINUE.value] * 2))
+
+    def test_wrong_move(self):
+        env = VecFourInRowEnv(num_envs=2)
+        env.register_trainer(FirstColPlayer('TST'))
+        for _ in range(3):
+            env.step(np.array([0, 1]))
+        state, rewards, dones, infos = env.step(np.array([0, 1]))
+        # Column 0 of the first game is full, the trainer must not move there
+        assert(rewards[0] == WrongValue)
+        assert(infos['wld'][0] == WLDEnum.WRONG_MOVE.value)
+        assert(infos['nwrong_moves'][0] == 1)
+        assert(np.count_nonzero(state[0]) == 6)
+        assert(dones[0] == False)
+
+    def test_trainer_required(self):
+        env = VecFourInRowEnv(num_envs=1)
+        with pytest.raises(AssertionError):
+            env.step(np.array([0]))
+
+    def test_matches_single_env(self):
+        num_envs = 8
+        rng = np.random.default_rng(11)
+        vec_env = VecFourInRowEnv(num_envs=num_envs)
+        vec_env.register_trainer(FirstColPlayer('TST'))
+        envs = [FourInRowEnv() for _ in range(num_envs)]
+        for env in envs:
+            env.register_trainer(FirstColPlayer('TST'))
+
+        nfinished = 0
+        for _ in range(300):
+            actions = rng.integers(0, 7, size=num_envs)
+            _, rewards, dones, infos = vec_env.step(actions)
+            for idx, env in enumerate(envs):
+                state, reward, done, (info, nwrong_moves) = env.step(int(actions[idx]))
+                assert(np.array_equal(state, infos['final_observation'][idx]))
+                assert(reward == rewards[idx])
+                assert(done == dones[idx])
+                assert((info or WLDEnum.CONTINUE).value == infos['wld'][idx])
+                assert(nwrong_moves == infos['nwrong_moves'][idx])
+                if done:
+                    nfinished += 1
+                    env.reset()
+            assert(np.array_equal(np.stack([env.state for env in envs]), vec_env.state))
+        assert(nfinished > 0), "At least a few games must have finished"
@@ -16,6 +16,11 @@ class NNPlayerBase(ABC):
     def get_action(self, state: ObsType) -> ActType:
         raise NotImplemented
 
+    def get_actions(self, states: np.ndarray) -> np.ndarray:
+        """ Returns an action per state of a (N, rows, cols) stack. Players that can
+            batch their work should override this """
+        return np.array([self.get_action(state) for state in states], dtype=np.int64)
+
     def update_internals(self, next_state:ObsType, state:ObsType, action:ActType, reward:int, done:bool) -> None:
         pass
 